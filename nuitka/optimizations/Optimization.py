@@ -43,7 +43,23 @@ from .BytecodeDemotion import demoteCompiledModuleToBytecode
 from .Tags import TagSet
 from .TraceCollections import withChangeIndicationsTo
 
-tag_set = None
+# The tag set is global, so it can track changes without context, and one
+# instance is enough when clearing it per module.
+tag_set = TagSet()
+
+
+# Option values checked in hot paths, they cannot change during optimization
+# and are cached once per pass.
+_is_verbose = False
+_tracing_memory = False
+
+
+def _initializeOptionsCache():
+    # Singleton, pylint: disable=global-statement
+    global _is_verbose, _tracing_memory
+
+    _is_verbose = Options.is_verbose
+    _tracing_memory = Options.isShowProgress() and Options.isShowMemory()
 
 
 def signalChange(tags, source_ref, message):
@@ -51,7 +67,7 @@ def signalChange(tags, source_ref, message):
     if message is not None:
         # Try hard to not call a delayed evaluation of node descriptions.
 
-        if Options.is_verbose:
+        if _is_verbose:
             optimization_logger.info(
                 "{source_ref} : {tags} : {message}".format(
                     source_ref=source_ref.getAsString(),
@@ -66,16 +82,23 @@ def signalChange(tags, source_ref, message):
 
 
 def optimizeCompiledPythonModule(module):
-    optimization_logger.info_fileoutput(
-        "Doing module local optimizations for '{module_name}'.".format(
-            module_name=module.getFullName()
-        ),
-        other_logger=progress_logger,
+    # The per-iteration messages go somewhere only in these cases, avoid
+    # formatting them per iteration otherwise.
+    tracing_module = (
+        optimization_logger.isFileOutput() or not progress_logger.isQuiet()
     )
 
+    if tracing_module:
+        optimization_logger.info_fileoutput(
+            "Doing module local optimizations for '{module_name}'.".format(
+                module_name=module.getFullName()
+            ),
+            other_logger=progress_logger,
+        )
+
     touched = False
 
-    if Options.isShowProgress() and Options.isShowMemory():
+    if _tracing_memory:
         memory_watch = MemoryWatch()
 
     # Temporary workaround, since we do some optimization based on the last pass results
@@ -102,37 +125,39 @@ def optimizeCompiledPythonModule(module):
         Graphs.onModuleOptimizationStep(module)
 
         # Ignore other modules brought into the game.
-        if "new_code" in tag_set:
-            tag_set.remove("new_code")
+        tag_set.discard("new_code")
 
         # Search for local change tags.
         if not tag_set:
             unchanged_count += 1
 
             if unchanged_count == 1 and pass_count == 1:
-                optimization_logger.info_fileoutput(
-                    "Not changed, but retrying one more time.",
-                    other_logger=progress_logger,
-                )
+                if tracing_module:
+                    optimization_logger.info_fileoutput(
+                        "Not changed, but retrying one more time.",
+                        other_logger=progress_logger,
+                    )
                 continue
 
-            optimization_logger.info_fileoutput(
-                "Finished with the module.", other_logger=progress_logger
-            )
+            if tracing_module:
+                optimization_logger.info_fileoutput(
+                    "Finished with the module.", other_logger=progress_logger
+                )
             break
 
         unchanged_count = 0
 
-        optimization_logger.info_fileoutput(
-            "Not finished with the module due to following change kinds: %s"
-            % ",".join(sorted(tag_set)),
-            other_logger=progress_logger,
-        )
+        if tracing_module:
+            optimization_logger.info_fileoutput(
+                "Not finished with the module due to following change kinds: %s"
+                % ",".join(sorted(tag_set)),
+                other_logger=progress_logger,
+            )
 
         # Otherwise we did stuff, so note that for return value.
         touched = True
 
-    if Options.isShowProgress() and Options.isShowMemory():
+    if _tracing_memory:
         memory_watch.finish(
             "Memory usage changed during optimization of '%s'" % (module.getFullName())
         )
@@ -166,10 +191,7 @@ def optimizeExtensionModule(module):
 
 
 def optimizeModule(module):
-    # The tag set is global, so it can track changes without context.
-    # pylint: disable=global-statement
-    global tag_set
-    tag_set = TagSet()
+    tag_set.clear()
 
     addExtraSysPaths(Plugins.getModuleSysPathAdditions(module.getFullName()))
 
@@ -227,7 +249,7 @@ after that.""".format(
         update=False,
     )
 
-    if Options.isShowProgress() and Options.isShowMemory():
+    if _tracing_memory:
         reportMemoryUsage(
             "optimization/%d/%s" % (pass_count, current_module.getFullName()),
             (
@@ -271,6 +293,8 @@ def makeOptimizationPass():
 
     finished = True
 
+    _initializeOptionsCache()
+
     ModuleRegistry.startTraversal()
 
     _restartProgress()
@@ -53,23 +53,85 @@ allowed_tags = (
 )
 
 
-class TagSet(set):
+# One bit per allowed tag, so tag membership and updates become single
+# integer operations rather than hashing in the hot signal path.
+_tag_bits = dict((tag, 1 << count) for count, tag in enumerate(allowed_tags))
+
+# Signal strings are a small fixed set of literals, cache their split and
+# validation, turning repeated signals into one dict lookup and one "or".
+_signal_masks = {}
+
+
+class TagSet(object):
+    __slots__ = ("mask",)
+
+    def __init__(self):
+        self.mask = 0
+
+    def __contains__(self, tag):
+        return self.mask & _tag_bits[tag] != 0
+
+    def __iter__(self):
+        for tag, tag_bit in _tag_bits.items():
+            if self.mask & tag_bit:
+                yield tag
+
+    def __len__(self):
+        return bin(self.mask).count("1")
+
+    def __nonzero__(self):
+        return self.mask != 0
+
+    __bool__ = __nonzero__
+
+    def clear(self):
+        self.mask = 0
+
+    def add(self, tag):
+        assert tag in _tag_bits, tag
+
+        self.mask |= _tag_bits[tag]
+
+    def remove(self, tag):
+        assert tag in self, tag
+
+        self.mask &= ~_tag_bits[tag]
+
+    def discard(self, tag):
+        assert tag in _tag_bits, tag
+
+        self.mask &= ~_tag_bits[tag]
+
     def onSignal(self, signal):
         if type(signal) is str:
-            signal = signal.split()
+            try:
+                mask = _signal_masks[signal]
+            except KeyError:
+                mask = 0
 
-        for tag in signal:
-            self.add(tag)
+                for tag in signal.split():
+                    assert tag in _tag_bits, tag
+
+                    mask |= _tag_bits[tag]
+
+                _signal_masks[signal] = mask
+
+            self.mask |= mask
+        else:
+            for tag in signal:
+                self.add(tag)
 
     def check(self, tags):
-        for tag in tags.split():
-            assert tag in allowed_tags, tag
+        try:
+            mask = _signal_masks[tags]
+        except KeyError:
+            mask = 0
 
-            if tag in self:
-                return True
-        return False
+            for tag in tags.split():
+                assert tag in _tag_bits, tag
 
-    def add(self, tag):
-        assert tag in allowed_tags, tag
+                mask |= _tag_bits[tag]
+
+            _signal_masks[tags] = mask
 
-        set.add(self, tag)
+        return self.mask & mask != 0
@@ -42,18 +42,23 @@ class Virtualenv(object):
         if type(commands) in (str, unicode):
             commands = [commands]
 
-        with withDirectoryChange(self.env_dir):
-            if os.name == "nt":
-                commands = [r"call scripts\activate.bat"] + commands
-            else:
-                commands = [". bin/activate"] + commands
+        # Change into the virtualenv inside of the shell command, rather than
+        # changing the process wide current directory, this allows concurrent
+        # use of multiple virtualenvs.
+        if os.name == "nt":
+            commands = [
+                'cd /d "%s"' % self.env_dir,
+                r"call scripts\activate.bat",
+            ] + commands
+        else:
+            commands = ['cd "%s"' % self.env_dir, ". bin/activate"] + commands
+
+        command = " && ".join(commands)
 
-            command = " && ".join(commands)
-
-            if style is not None:
-                my_print("Executing: %s" % command, style=style)
+        if style is not None:
+            my_print("Executing: %s" % command, style=style)
 
-            assert os.system(command) == 0, command
+        assert os.system(command) == 0, command
 
     def runCommandWithOutput(self, commands, style=None):
         """
@@ -62,23 +67,25 @@ class Virtualenv(object):
         if type(commands) in (str, unicode):
             commands = [commands]
 
-        with withDirectoryChange(self.env_dir):
-            if os.name == "nt":
-                commands = [r"call scripts\activate.bat"] + commands
-            else:
-                commands = [". bin/activate"] + commands
+        if os.name == "nt":
+            commands = [
+                'cd /d "%s"' % self.env_dir,
+                r"call scripts\activate.bat",
+            ] + commands
+        else:
+            commands = ['cd "%s"' % self.env_dir, ". bin/activate"] + commands
 
-            # Build shell command.
-            command = " && ".join(commands)
+        # Build shell command.
+        command = " && ".join(commands)
 
-            if style is not None:
-                my_print("Executing: %s" % command, style=style)
+        if style is not None:
+            my_print("Executing: %s" % command, style=style)
 
-            # Use subprocess and also return outputs, stdout, stderr, result
-            return executeProcess(
-                command=command,
-                shell=True,
-            )
+        # Use subprocess and also return outputs, stdout, stderr, result
+        return executeProcess(
+            command=command,
+            shell=True,
+        )
 
     def getVirtualenvDir(self):
         return self.env_dir
@@ -21,40 +21,99 @@
 
 import os
 import shutil
+import stat
 import sys
+import tarfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 from nuitka.tools.environments.Virtualenv import withVirtualenv
 from nuitka.tools.release.Documentation import createReleaseDocumentation
 from nuitka.tools.release.Release import checkBranchName
 from nuitka.Tracing import my_print
+from nuitka.utils.Execution import check_call
+from nuitka.utils.FileOperations import (
+    replaceFileAtomic,
+    resolveShellPatternToFilenames,
+)
 from nuitka.utils.InstalledPythons import findInstalledPython
 from nuitka.Version import getNuitkaVersion
 
 
+def _makeTreeWorldReadable():
+    # Same as "chmod -R a+rX .", but without forking a shell, everybody gets
+    # to read, and to execute what is a directory or already executable.
+    for root, dirnames, filenames in os.walk("."):
+        for path in [os.path.join(root, dirname) for dirname in dirnames] + [
+            os.path.join(root, filename) for filename in filenames
+        ]:
+            if os.path.islink(path):
+                continue
+
+            mode = os.stat(path).st_mode
+            new_mode = mode | 0o444
+
+            if stat.S_ISDIR(mode) or mode & 0o111:
+                new_mode |= 0o111
+
+            if new_mode != mode:
+                os.chmod(path, new_mode)
+
+
+def _stripRequiresFileFromSdist():
+    # Delete requires.txt from the sdist as it confuses poetry and potentially
+    # other tools, doing the rewrite with "tarfile" in one pass rather than
+    # spawning gunzip, tar and gzip processes.
+    sdist_filename = resolveShellPatternToFilenames("dist/Nuitka*.tar.gz")[0]
+    tmp_filename = sdist_filename + ".tmp"
+
+    with tarfile.open(sdist_filename, "r:gz") as source_sdist:
+        # Level 6 compresses sdists a lot faster than level 9 at well below
+        # one percent size difference.
+        with tarfile.open(tmp_filename, "w:gz", compresslevel=6) as dest_sdist:
+            for member in source_sdist:
+                if member.name.endswith("Nuitka.egg-info/requires.txt"):
+                    continue
+
+                if member.isfile():
+                    dest_sdist.addfile(member, source_sdist.extractfile(member))
+                else:
+                    dest_sdist.addfile(member)
+
+    replaceFileAtomic(tmp_filename, sdist_filename)
+
+
+# Lock to keep printed banners of concurrent virtualenv checks readable.
+_print_lock = threading.Lock()
+
+
+def _printBanner(message):
+    with _print_lock:
+        my_print(message, style="blue")
+        my_print("*" * 40, style="blue")
+
+
 def _checkNuitkaInVirtualenv(python):
+    # Use one virtualenv per Python version, so checks can run concurrently.
     with withVirtualenv(
-        "venv_nuitka", style="blue", python=python.getPythonExe()
+        "venv_nuitka_%s" % python.getPythonVersion(),
+        style="blue",
+        python=python.getPythonExe(),
     ) as venv:
-        my_print("Installing Nuitka into virtualenv:", style="blue")
-        my_print("*" * 40, style="blue")
+        _printBanner("Installing Nuitka into virtualenv:")
         venv.runCommand("python -m pip install ../dist/Nuitka*.tar.gz")
-        my_print("*" * 40, style="blue")
 
-        my_print("Compiling basic test with runner:", style="blue")
-        my_print("*" * 40, style="blue")
+        _printBanner("Compiling basic test with runner:")
         venv.runCommand(
             "nuitka%s ../tests/basics/AssertsTest.py" % python.getPythonVersion()[0],
             style="blue",
         )
-        my_print("*" * 40, style="blue")
 
-        my_print("Compiling basic test with recommended -m mode:", style="blue")
-        my_print("*" * 40, style="blue")
+        _printBanner("Compiling basic test with recommended -m mode:")
         venv.runCommand(
             "python -m nuitka ../tests/basics/AssertsTest.py",
             style="blue",
         )
-        my_print("*" * 40, style="blue")
 
 
 def main():
@@ -74,23 +133,18 @@ def main():
     shutil.rmtree("check_nuitka", ignore_errors=True)
     shutil.rmtree("dist", ignore_errors=True)
 
+    # One validated environment for all release subprocesses.
+    env = dict(os.environ)
+
     my_print("Creating documentation.", style="blue")
     createReleaseDocumentation()
     my_print("Creating source distribution.", style="blue")
-    assert (
-        os.system("umask 0022 && chmod -R a+rX . && %s setup.py sdist" % sys.executable)
-        == 0
-    )
-
-    # Delete requires.txt as it confuses poetry and potentially other tools
-    assert os.system("gunzip dist/Nuitka*.tar.gz") == 0
-    assert (
-        os.system(
-            "tar --wildcards --delete --file dist/Nuitka*.tar Nuitka-*/Nuitka.egg-info/requires.txt"
-        )
-        == 0
-    )
-    assert os.system("gzip -9 dist/Nuitka*.tar") == 0
+    old_umask = os.umask(0o022)
+    _makeTreeWorldReadable()
+    check_call([sys.executable, "setup.py", "sdist"], env=env)
+    os.umask(old_umask)
+
+    _stripRequiresFileFromSdist()
 
     pythons = [
         findInstalledPython(
@@ -101,14 +155,24 @@ def main():
         ),
     ]
 
-    for python in pythons:
-        _checkNuitkaInVirtualenv(python)
+    dist_filenames = resolveShellPatternToFilenames("dist/*")
+
+    # The virtualenv checks are independent of each other and of the twine
+    # metadata check, and all are dominated by subprocess wall time, so run
+    # them concurrently. Only the upload depends on all of them passing.
+    with ThreadPoolExecutor(max_workers=len(pythons) + 1) as executor:
+        twine_check = executor.submit(
+            check_call, [sys.executable, "-m", "twine", "check"] + dist_filenames, env=env
+        )
+
+        for _result in executor.map(_checkNuitkaInVirtualenv, pythons):
+            pass
 
-    assert os.system("twine check dist/*") == 0
+        twine_check.result()
 
     if not check_mode:
         my_print("Uploading source dist")
-        assert os.system("twine upload dist/*") == 0
+        check_call([sys.executable, "-m", "twine", "upload"] + dist_filenames, env=env)
         my_print("Uploaded.")
     else:
         my_print("Checked OK, but not uploaded.")
@@ -237,6 +237,12 @@ exceeded while calling a Python object' in \
 def compareOutput(
     kind, out_cpython, out_nuitka, ignore_warnings, syntax_errors, trace_result=True
 ):
+    # Fast path, identical raw outputs normalize identically and cannot
+    # diff, which spares the expensive line normalization and diffing on
+    # large outputs for the common case of matching runs.
+    if out_cpython == out_nuitka:
+        return 0
+
     from_date = ""
     to_date = ""
 
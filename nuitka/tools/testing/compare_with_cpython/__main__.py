@@ -22,10 +22,13 @@
 """
 
 import hashlib
+import mmap
 import os
 import pickle
+import random
 import re
 import sys
+import threading
 import time
 
 from nuitka.OptionParsing import getNuitkaProjectOptions
@@ -48,48 +51,155 @@ from nuitka.utils.Execution import (
     check_output,
     createProcess,
     executeProcess,
+    getExecutablePath,
     wrapCommandForDebuggerForSubprocess,
 )
+from nuitka.utils.FileOperations import replaceFileAtomic
 from nuitka.utils.Importing import getSharedLibrarySuffix
 from nuitka.utils.Timing import StopWatch
 
 
+_output_encoding = "cp850" if os.name == "nt" else "utf-8"
+
+
 def displayOutput(stdout, stderr):
-    if type(stdout) is not str:
-        stdout = stdout.decode("utf-8" if os.name != "nt" else "cp850")
-        stderr = stderr.decode("utf-8" if os.name != "nt" else "cp850")
+    if isinstance(stdout, (bytes, bytearray)):
+        if str is not bytes and os.name != "nt":
+            # Python3 can write the captured bytes straight out, sparing the
+            # decode and encode round trip. Not on Windows, where captured
+            # output is cp850 but the console stream is not.
+            sys.stdout.flush()
+            sys.stdout.buffer.write(stdout)
+            sys.stdout.buffer.write(b" ")
+
+            if stderr:
+                sys.stdout.buffer.write(stderr)
+                sys.stdout.buffer.write(b"\n")
+
+            sys.stdout.buffer.flush()
+            return
+
+        stdout = stdout.decode(_output_encoding)
+        stderr = stderr.decode(_output_encoding)
 
     my_print(stdout, end=" ")
     if stderr:
         my_print(stderr)
 
 
+# Forms of permission errors, the clcache lock problem gets a retry as well.
+_permission_error_literals = (
+    b"Permission denied:",
+    b"PermissionError:",
+    b"DBPermissionsError:",
+    b"clcache.__main__.CacheLockException",
+)
+
+# These are localized it seems, spell-checker: ignore totest
+_localized_permission_error_re = re.compile(
+    b"(?:WindowsError|FileNotFoundError|FileExistsError|WinError 145):"
+    b".*(?:@test|totest|xx|Error 145)"
+)
+
+
 def checkNoPermissionError(output):
-    # Forms of permission errors.
-    for candidate in (
-        b"Permission denied:",
-        b"PermissionError:",
-        b"DBPermissionsError:",
-    ):
+    for candidate in _permission_error_literals:
         if candidate in output:
             return False
 
-    # These are localized it seems, spell-checker: ignore totest
-    if re.search(
-        b"(WindowsError|FileNotFoundError|FileExistsError|WinError 145):"
-        b".*(@test|totest|xx|Error 145)",
-        output,
-    ):
-        return False
+    return _localized_permission_error_re.search(output) is None
+
+
+def _sleepRetryDelay(attempt):
+    """Sleep before retrying a transient failure.
+
+    Exponential backoff, since transient permission problems typically clear
+    quickly, and jitter, so parallel test runners do not retry in lockstep.
+    """
+    time.sleep(min(2.0, 0.1 * 2**attempt) * (1 + random.random() * 0.5))
+
+
+# The sys.path of a Python binary as needed for coverage mode, cached in
+# process and with an on-disk sidecar, so repeated invocations skip the full
+# interpreter launch of the probe.
+_python_syspath_cache = {}
+
+
+def _getPythonSysPath(python_exe):
+    if python_exe in _python_syspath_cache:
+        return _python_syspath_cache[python_exe]
+
+    # The "PYTHON" value may be a bare command name, resolve it through PATH
+    # like the process launch would, so the sidecar key can stat it.
+    resolved_exe = getExecutablePath(python_exe) or python_exe
+
+    try:
+        exe_mtime = os.path.getmtime(resolved_exe)
+    except OSError:
+        # Without a stat there is no sidecar key, probe without caching on
+        # disk then, and leave complaining about a bad value to the probe.
+        cache_filename = None
+    else:
+        key_hash = _createHash(resolved_exe.encode("utf8"))
+        key_hash.update(str(exe_mtime).encode("utf8"))
+
+        cache_filename = os.path.join(
+            getTestingCPythonOutputsCacheDir(), "syspath-%s.txt" % key_hash.hexdigest()
+        )
+
+    python_path = None
+
+    if cache_filename is not None:
+        try:
+            with open(cache_filename, "r") as cache_file:
+                python_path = cache_file.read()
+        except IOError:
+            pass
+
+    if python_path is None:
+        python_path = check_output(
+            [python_exe, "-c", "import sys, os; print(os.pathsep.join(sys.path))"]
+        )
+
+        if str is not bytes:
+            python_path = python_path.decode("utf8")
+
+        python_path = python_path.strip()
+
+        if cache_filename is not None:
+            # The cache directory is shared with parallel test drivers, so
+            # never let them see a partial write.
+            tmp_filename = "%s.%d" % (cache_filename, os.getpid())
+
+            with open(tmp_filename, "w") as cache_file:
+                cache_file.write(python_path)
+
+            replaceFileAtomic(tmp_filename, cache_filename)
+
+    _python_syspath_cache[python_exe] = python_path
 
-    # Give those a retry as well.
-    if b"clcache.__main__.CacheLockException" in output:
-        return False
+    return python_path
 
-    return True
 
+def _makeEnvWithPythonPath(python_path):
+    """Environment as withPythonPathChange makes it, but per process.
 
-def _getCPythonResults(cpython_cmd, send_kill):
+    Passing this to the process launch rather than changing the process
+    global environment is safe against concurrent use.
+    """
+    env = dict(os.environ)
+
+    python_path = os.path.normpath(os.path.abspath(python_path))
+
+    if "PYTHONPATH" in env:
+        env["PYTHONPATH"] += os.pathsep + python_path
+    else:
+        env["PYTHONPATH"] = python_path
+
+    return env
+
+
+def _getCPythonResults(cpython_cmd, send_kill, env=None, cwd=None):
     stop_watch = StopWatch()
 
     # Try a compile of times for permission denied, on Windows it can
@@ -97,8 +207,9 @@ def _getCPythonResults(cpython_cmd, send_kill):
     for _i in range(5):
         stop_watch.start()
 
-        with withPythonPathChange(os.getcwd()):
-            process = createProcess(command=cpython_cmd, new_group=send_kill)
+        process = createProcess(
+            command=cpython_cmd, env=env, new_group=send_kill, cwd=cwd
+        )
 
         if send_kill:
             # Doing it per loop iteration hopefully, pylint: disable=cell-var-from-loop
@@ -119,14 +230,127 @@ def _getCPythonResults(cpython_cmd, send_kill):
             break
 
         my_print("Retrying CPython due to permission problems after delay.")
-        time.sleep(2)
+        _sleepRetryDelay(_i)
 
     cpython_time = stop_watch.getDelta()
 
     return cpython_time, stdout_cpython, stderr_cpython, exit_cpython
 
 
-def getCPythonResults(cpython_cmd, cpython_cached, force_update, send_kill):
+def _createHash(data):
+    # BLAKE2b is considerably faster per byte than MD5, use MD5 only as a
+    # fallback, e.g. where FIPS mode or old Python doesn't provide BLAKE2.
+    try:
+        return hashlib.blake2b(data, digest_size=8)
+    except (AttributeError, ValueError):
+        return hashlib.md5(data)
+
+
+# Persistent map of file path to (mtime, size, digest), so unchanged files
+# need not be re-hashed on every invocation, loaded and saved on demand.
+_file_digest_cache = None
+_file_digest_cache_dirty = False
+
+
+def _getFileDigestCacheFilename():
+    return os.path.join(getTestingCPythonOutputsCacheDir(), "file-digests.pkl")
+
+
+def _getFileDigest(filename):
+    # Using a singleton cache, pylint: disable=global-statement
+    global _file_digest_cache, _file_digest_cache_dirty
+
+    if _file_digest_cache is None:
+        try:
+            with open(_getFileDigestCacheFilename(), "rb") as cache_file:
+                _file_digest_cache = pickle.load(cache_file)
+        except (IOError, EOFError, ValueError):
+            _file_digest_cache = {}
+
+    filename = os.path.abspath(filename)
+    file_stat = os.stat(filename)
+    file_mtime = getattr(file_stat, "st_mtime_ns", file_stat.st_mtime)
+
+    entry = _file_digest_cache.get(filename)
+
+    if entry is not None and entry[0] == file_mtime and entry[1] == file_stat.st_size:
+        return entry[2]
+
+    file_hash = _createHash(b"")
+    _updateCommandHashFromFile(file_hash, filename)
+    digest = file_hash.digest()
+
+    _file_digest_cache[filename] = (file_mtime, file_stat.st_size, digest)
+    _file_digest_cache_dirty = True
+
+    return digest
+
+
+def _saveFileDigestCache():
+    # Using a singleton cache, pylint: disable=global-statement
+    global _file_digest_cache_dirty
+
+    if not _file_digest_cache_dirty:
+        return
+
+    cache_filename = _getFileDigestCacheFilename()
+    tmp_filename = "%s.%d" % (cache_filename, os.getpid())
+
+    with open(tmp_filename, "wb") as cache_file:
+        pickle.dump(
+            _file_digest_cache, cache_file, protocol=pickle.HIGHEST_PROTOCOL
+        )
+
+    replaceFileAtomic(tmp_filename, cache_filename)
+
+    _file_digest_cache_dirty = False
+
+
+def _updateHashFromFileHandle(command_hash, input_file, bufsize=131072):
+    # Drive the hash with reads into a fixed 128 KiB buffer, large enough to
+    # be bandwidth rather than syscall limited, without a full size
+    # allocation.
+    buf = bytearray(bufsize)
+    view = memoryview(buf)
+
+    while True:
+        count = input_file.readinto(buf)
+
+        if not count:
+            break
+
+        command_hash.update(view[:count])
+
+
+def _updateCommandHashFromFile(command_hash, filename):
+    # Stream the file contents into the hash, rather than allocating one bytes
+    # object of the full file size. For larger files use mmap, so pages come
+    # zero-copy from the page cache, small files and mmap failures take the
+    # chunked read path.
+    file_size = os.path.getsize(filename)
+
+    with open(filename, "rb", buffering=0) as input_file:
+        if file_size >= 65536:
+            try:
+                mapped_file = mmap.mmap(
+                    input_file.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except (OSError, ValueError):
+                pass
+            else:
+                try:
+                    command_hash.update(mapped_file)
+                finally:
+                    mapped_file.close()
+
+                return
+
+        _updateHashFromFileHandle(command_hash, input_file)
+
+
+def getCPythonResults(
+    cpython_cmd, cpython_cached, force_update, send_kill, env=None, cwd=None
+):
     # Many details, pylint: disable=too-many-locals
 
     cached = False
@@ -137,12 +361,13 @@ def getCPythonResults(cpython_cmd, cpython_cached, force_update, send_kill):
         if str is not bytes:
             hash_input = hash_input.encode("utf8")
 
-        command_hash = hashlib.md5(hash_input)
+        command_hash = _createHash(hash_input)
 
         for element in cpython_cmd:
             if os.path.exists(element):
-                with open(element, "rb") as element_file:
-                    command_hash.update(element_file.read())
+                command_hash.update(_getFileDigest(element))
+
+        _saveFileDigestCache()
 
         hash_salt = os.environ.get("NUITKA_HASH_SALT", "")
 
@@ -150,7 +375,9 @@ def getCPythonResults(cpython_cmd, cpython_cached, force_update, send_kill):
             hash_salt = hash_salt.encode("utf8")
         command_hash.update(hash_salt)
 
-        if os.name == "nt" and python_version < 0x300:
+        if cwd is not None:
+            curdir = cwd
+        elif os.name == "nt" and python_version < 0x300:
             curdir = os.getcwdu()  # spell-checker: ignore getcwdu
         else:
             curdir = os.getcwd()
@@ -170,32 +397,42 @@ def getCPythonResults(cpython_cmd, cpython_cached, force_update, send_kill):
                         stderr_cpython,
                         exit_cpython,
                     ) = pickle.load(cache_file)
-            except (IOError, EOFError):
-                # Broken cache content.
+            except (IOError, EOFError, ValueError):
+                # Broken cache content, or pickle protocol from an
+                # incompatible Python version.
                 pass
             else:
                 cached = True
 
     if not cached:
+        if env is None:
+            env = _makeEnvWithPythonPath(os.getcwd())
+
         cpython_time, stdout_cpython, stderr_cpython, exit_cpython = _getCPythonResults(
-            cpython_cmd=cpython_cmd, send_kill=send_kill
+            cpython_cmd=cpython_cmd, send_kill=send_kill, env=env, cwd=cwd
         )
 
         if cpython_cached:
             with open(cache_filename, "wb") as cache_file:
+                # Binary pickle protocols store the output bytes as-is, the
+                # default protocol would escape them expensively.
                 pickle.dump(
                     (cpython_time, stdout_cpython, stderr_cpython, exit_cpython),
                     cache_file,
+                    protocol=pickle.HIGHEST_PROTOCOL,
                 )
 
     return cpython_time, stdout_cpython, stderr_cpython, exit_cpython
 
 
-def main():
+def main(argv=None):
     # Of course many cases to deal with, pylint: disable=too-many-branches,too-many-locals,too-many-statements
 
-    filename = sys.argv[1]
-    args = sys.argv[2:]
+    if argv is None:
+        argv = sys.argv[1:]
+
+    filename = argv[0]
+    args = list(argv[1:])
 
     def hasArg(arg):
         if arg in args:
@@ -265,30 +502,29 @@ def main():
     include_modules = hasArgValues("--include-module")
     python_flag_m = hasArg("--python-flag=-m")
 
+    # Peel off all prefixed arguments in one pass over the remaining args.
     plugins_enabled = []
-    for count, arg in reversed(tuple(enumerate(args))):
-        if arg.startswith("plugin_enable:"):
-            plugins_enabled.append(arg[len("plugin_enable:") :])
-            del args[count]
-
     plugins_disabled = []
-    for count, arg in reversed(tuple(enumerate(args))):
-        if arg.startswith("plugin_disable:"):
-            plugins_disabled.append(arg[len("plugin_disable:") :])
-            del args[count]
-
     user_plugins = []
-    for count, arg in reversed(tuple(enumerate(args))):
-        if arg.startswith("user_plugin:"):
-            user_plugins.append(arg[len("user_plugin:") :])
-            del args[count]
-
     nowarn_mnemonics = []
 
-    for count, arg in reversed(tuple(enumerate(args))):
-        if arg.startswith("--nowarn-mnemonic="):
-            nowarn_mnemonics.append(arg[len("--nowarn-mnemonic=") :])
-            del args[count]
+    prefix_args = (
+        ("plugin_enable:", plugins_enabled),
+        ("plugin_disable:", plugins_disabled),
+        ("user_plugin:", user_plugins),
+        ("--nowarn-mnemonic=", nowarn_mnemonics),
+    )
+
+    leftover_args = []
+    for arg in args:
+        for prefix, values in prefix_args:
+            if arg.startswith(prefix):
+                values.append(arg[len(prefix) :])
+                break
+        else:
+            leftover_args.append(arg)
+
+    args[:] = leftover_args
 
     if args:
         sys.exit("Error, non understood mode(s) '%s'," % ",".join(args))
@@ -329,25 +565,28 @@ def main():
 
     os.environ["PYTHONWARNINGS"] = "ignore"
 
-    if "PYTHON" not in os.environ:
-        os.environ["PYTHON"] = sys.executable
+    # Cache the tested Python locally, rather than re-reading the environment
+    # dozens of times below, the environment value is kept in sync for child
+    # processes and other readers.
+    python_exe = os.environ.setdefault("PYTHON", sys.executable)
 
     extra_options = os.environ.get("NUITKA_EXTRA_OPTIONS", "").split()
 
-    if os.path.normcase(os.environ["PYTHON"]).endswith(("-dbg", "-debug", "_d.exe")):
+    if os.path.normcase(python_exe).endswith(("-dbg", "-debug", "_d.exe")):
         python_debug = True
     elif "--python-debug" in extra_options or "--python-dbg" in extra_options:
         python_debug = True
 
     if python_debug:
-        os.environ["PYTHON"] = getDebugPython() or os.environ["PYTHON"]
+        python_exe = getDebugPython() or python_exe
+        os.environ["PYTHON"] = python_exe
 
     if comparison_mode:
         my_print(
             """\
 Comparing output of '{filename}' using '{python}' with flags {args} ...""".format(
                 filename=filename,
-                python=os.environ["PYTHON"],
+                python=python_exe,
                 args=", ".join(arguments),
             )
         )
@@ -356,16 +595,11 @@ Comparing output of '{filename}' using '{python}' with flags {args} ...""".forma
             """\
 Taking coverage of '{filename}' using '{python}' with flags {args} ...""".format(
                 filename=filename,
-                python=os.environ["PYTHON"],
+                python=python_exe,
                 args=", ".join(arguments),
             )
         )
 
-    if comparison_mode and not silent_mode:
-        my_print("*" * 80)
-        my_print("CPython:")
-        my_print("*" * 80)
-
     if two_step_execution:
         filename = os.path.abspath(filename)
 
@@ -380,7 +614,7 @@ Taking coverage of '{filename}' using '{python}' with flags {args} ...""".format
             mini_script += "; %s.%s()" % (module_name, module_entry_point)
 
         cpython_cmd = [
-            os.environ["PYTHON"],
+            python_exe,
             "-c",
             "import sys; sys.path.append(%s); %s"
             % (repr(os.path.dirname(filename)), mini_script),
@@ -392,7 +626,7 @@ Taking coverage of '{filename}' using '{python}' with flags {args} ...""".format
                 "ignore",
             ]
     else:
-        cpython_cmd = [os.environ["PYTHON"]]
+        cpython_cmd = [python_exe]
 
         if no_warnings:
             cpython_cmd[1:1] = [
@@ -413,11 +647,11 @@ Taking coverage of '{filename}' using '{python}' with flags {args} ...""".format
         # Would need to extract which "python" this is going to use.
         assert not coverage_mode, "Not implemented for binaries."
 
-        nuitka_call = [os.environ["PYTHON"], os.environ["NUITKA"]]
+        nuitka_call = [python_exe, os.environ["NUITKA"]]
     else:
         if comparison_mode:
             nuitka_call = [
-                os.environ["PYTHON"],
+                python_exe,
                 "-m",
                 "nuitka.__main__",  # Note: Needed for Python2.6
             ]
@@ -427,7 +661,7 @@ Taking coverage of '{filename}' using '{python}' with flags {args} ...""".format
             # spell-checker: ignore rcfile
 
             nuitka_call = [
-                os.environ["PYTHON"],
+                python_exe,
                 "-S",
                 "-m",
                 "coverage",
@@ -466,18 +700,7 @@ Taking coverage of '{filename}' using '{python}' with flags {args} ...""".format
     if coverage_mode:
         # Coverage modules hates Nuitka to re-execute, and so we must avoid
         # that.
-        python_path = check_output(
-            [
-                os.environ["PYTHON"],
-                "-c",
-                "import sys, os; print(os.pathsep.join(sys.path))",
-            ]
-        )
-
-        if sys.version_info >= (3,):
-            python_path = python_path.decode("utf8")
-
-        os.environ["PYTHONPATH"] = python_path.strip()
+        os.environ["PYTHONPATH"] = _getPythonSysPath(python_exe)
 
     if binary_python_path:
         addToPythonPath(os.path.dirname(os.path.abspath(filename)))
@@ -519,16 +742,18 @@ Taking coverage of '{filename}' using '{python}' with flags {args} ...""".format
     if output_dir is not None:
         extra_options.append("--output-dir=%s" % output_dir)
     else:
-        # TODO: The run-tests uses NUITKA_EXTRA_OPTIONS still.
-        for extra_option in extra_options:
-            dir_match = re.search(r"--output-dir=(.*?)(\s|$)", extra_option)
-
-            if dir_match:
-                output_dir = dir_match.group(1)
-                break
-        else:
+        # TODO: The run-tests uses NUITKA_EXTRA_OPTIONS still. The options
+        # come from a whitespace split, so a simple prefix match on each
+        # token finds the value, no need for a regex.
+        output_dir = next(
+            (
+                extra_option[len("--output-dir=") :]
+                for extra_option in extra_options
+                if extra_option.startswith("--output-dir=")
+            ),
             # The default.
-            output_dir = "."
+            ".",
+        )
 
     for include_package in include_packages:
         extra_options.append("--include-package=%s" % include_package)
@@ -572,7 +797,7 @@ Taking coverage of '{filename}' using '{python}' with flags {args} ...""".format
         if module_name.endswith(".py"):
             module_name = module_name[:-3]
 
-        nuitka_cmd2 = [os.environ["PYTHON"], "-W", "ignore", "-c", mini_script]
+        nuitka_cmd2 = [python_exe, "-W", "ignore", "-c", mini_script]
     else:
         exe_filename = os.path.basename(filename)
 
@@ -594,20 +819,45 @@ Taking coverage of '{filename}' using '{python}' with flags {args} ...""".format
         traceExecutedCommand("CPython command", cpython_cmd)
 
     if comparison_mode:
-        cpython_time, stdout_cpython, stderr_cpython, exit_cpython = getCPythonResults(
-            cpython_cmd=cpython_cmd,
-            cpython_cached=cpython_cached,
-            force_update=False,
-            send_kill=send_kill,
-        )
+        # The CPython run is independent of the Nuitka compile, launch it in
+        # the background, so both overlap, and only collect the results when
+        # needed. The environment and current directory are snapshot here, so
+        # neither the Nuitka side changing the process environment nor the
+        # two step mode changing directory can interfere. The overlap must
+        # not extend to executing the compiled test program though, both
+        # sides run the same test script, and tests mutate fixed workspace
+        # paths, so we wait before any test execution starts.
+        cpython_results = {}
+        cpython_env = _makeEnvWithPythonPath(os.getcwd())
 
-        if not silent_mode:
-            displayOutput(stdout_cpython, stderr_cpython)
+        if os.name == "nt" and python_version < 0x300:
+            cpython_cwd = os.getcwdu()
+        else:
+            cpython_cwd = os.getcwd()
 
-    if comparison_mode and not silent_mode:
-        my_print("*" * 80)
-        my_print("Nuitka:")
-        my_print("*" * 80)
+        def fetchCPythonResults():
+            try:
+                cpython_results["result"] = getCPythonResults(
+                    cpython_cmd=cpython_cmd,
+                    cpython_cached=cpython_cached,
+                    force_update=False,
+                    send_kill=send_kill,
+                    env=cpython_env,
+                    cwd=cpython_cwd,
+                )
+            except BaseException as e:  # pylint: disable=broad-except
+                cpython_results["error"] = e
+
+        cpython_thread = threading.Thread(target=fetchCPythonResults)
+        cpython_thread.start()
+
+        def waitCPythonResults():
+            cpython_thread.join()
+
+            if "error" in cpython_results:
+                raise cpython_results["error"]
+
+            return cpython_results["result"]
 
     if two_step_execution:
         if output_dir:
@@ -623,6 +873,12 @@ Taking coverage of '{filename}' using '{python}' with flags {args} ...""".format
     stop_watch.start()
 
     if not two_step_execution:
+        if comparison_mode:
+            # With "--run" the compile and the test execution are one
+            # process, so there is no later point to wait at, the overlap
+            # ends here.
+            waitCPythonResults()
+
         if trace_command:
             traceExecutedCommand("Nuitka command", nuitka_cmd)
 
@@ -641,7 +897,7 @@ Taking coverage of '{filename}' using '{python}' with flags {args} ...""".format
                 break
 
             my_print("Retrying nuitka exe due to permission problems after delay.")
-            time.sleep(2)
+            _sleepRetryDelay(_i)
 
     else:
         if trace_command:
@@ -678,6 +934,11 @@ Stderr was:
             else:
                 # No execution second step for coverage mode.
                 if comparison_mode:
+                    # The compile is done, but the compiled test program
+                    # must not run while the CPython reference run is still
+                    # in flight.
+                    waitCPythonResults()
+
                     if os.path.exists(nuitka_cmd2[0][:-4] + ".cmd"):
                         nuitka_cmd2[0] = nuitka_cmd2[0][:-4] + ".cmd"
 
@@ -717,11 +978,27 @@ Stderr was:
                 break
 
             my_print("Retrying nuitka exe due to permission problems after delay.")
-            time.sleep(2)
+            _sleepRetryDelay(_i)
 
     stop_watch.stop()
     nuitka_time = stop_watch.getDelta()
 
+    if comparison_mode:
+        cpython_time, stdout_cpython, stderr_cpython, exit_cpython = (
+            waitCPythonResults()
+        )
+
+        if not silent_mode:
+            my_print("*" * 80)
+            my_print("CPython:")
+            my_print("*" * 80)
+
+            displayOutput(stdout_cpython, stderr_cpython)
+
+            my_print("*" * 80)
+            my_print("Nuitka:")
+            my_print("*" * 80)
+
     if not silent_mode:
         displayOutput(stdout_nuitka, stderr_nuitka)
 
@@ -788,6 +1065,7 @@ Stderr was:
                         cpython_cached=cpython_cached,
                         force_update=True,
                         send_kill=send_kill,
+                        env=cpython_env,
                     )
 
                     if not silent_mode:
@@ -883,6 +1161,53 @@ Stderr was:
         my_print("OK, same outputs.")
 
 
+def runComparison(argv):
+    """Run a single comparison, giving an exit code rather than exiting.
+
+    This is for reuse from drivers that dispatch many test files without
+    spawning one fresh Python per file.
+    """
+
+    # The comparison changes process global state, restore it afterwards, so
+    # that pooled workers can be reused across test files.
+    old_cwd = os.getcwd()
+    old_environ = dict(os.environ)
+
+    try:
+        main(argv)
+    except SystemExit as e:
+        code = e.code
+
+        if code is None:
+            return 0
+        elif type(code) is int:
+            return code
+        else:
+            my_print(code, file=sys.stderr)
+            return 1
+    finally:
+        os.chdir(old_cwd)
+        os.environ.clear()
+        os.environ.update(old_environ)
+
+    return 0
+
+
+def runMany(argv_lists, max_workers=None):
+    """Run many comparisons in reusable worker processes.
+
+    Each worker imports this module and therefore nuitka only once, which
+    amortizes interpreter startup and import time over all test files.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if max_workers is None:
+        max_workers = os.cpu_count()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(runComparison, argv_lists))
+
+
 nuitka_package_dir = os.path.normpath(
     os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", ".."))
 )
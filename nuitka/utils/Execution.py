@@ -373,6 +373,7 @@ def createProcess(
     shell=False,
     external_cwd=False,
     new_group=False,
+    cwd=None,
 ):
     if not env:
         env = os.environ
@@ -381,8 +382,14 @@ def createProcess(
     if new_group:
         if isWin32Windows():
             kw_args["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
-        else:
+        elif str is bytes:
+            # Python2 only knows the callback form.
             kw_args["preexec_fn"] = os.setsid
+        else:
+            # Same effect as a "os.setsid" callback, but done by subprocess
+            # itself, no Python code runs between fork and exec, which is
+            # what makes "preexec_fn" unsafe with threads in the parent.
+            kw_args["start_new_session"] = True
 
     process = subprocess.Popen(
         command,
@@ -396,7 +403,7 @@ def createProcess(
         close_fds=not isWin32Windows(),
         env=env,
         # For tools that want short paths to work.
-        cwd=getExternalUsePath(os.getcwd()) if external_cwd else None,
+        cwd=getExternalUsePath(os.getcwd()) if external_cwd else cwd,
         **kw_args
     )
 